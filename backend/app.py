@@ -1,22 +1,44 @@
 import os
-import json
 import random
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
-try:
-    import google.generativeai as genai
-except Exception:  # pragma: no cover - optional at dev time
-    genai = None
+load_dotenv()
+
+# The Gemini SDK is slow to import; skip it entirely when no key is configured.
+genai = None
+if os.getenv("GEMINI_API_KEY"):
+    try:
+        import google.generativeai as genai
+    except Exception:  # pragma: no cover - optional at dev time
+        genai = None
 
 
-load_dotenv()
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() encodes in C."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 
@@ -24,27 +46,141 @@ WEATHERAPI_KEY = os.getenv("WEATHERAPI_KEY", "")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
 
-if GEMINI_API_KEY and genai is not None:
-    genai.configure(api_key=GEMINI_API_KEY)
+_HAS_GEMINI = bool(GEMINI_API_KEY) and genai is not None
+
+_GEMINI = None
+if _HAS_GEMINI:
+    # REST transport goes through plain sockets, which the gevent worker patches;
+    # the SDK's default gRPC transport would block the whole worker per call.
+    genai.configure(api_key=GEMINI_API_KEY, transport="rest")
+    # One shared model instance; the SDK client is safe to use across threads
+    _GEMINI = genai.GenerativeModel(GEMINI_MODEL)
+
+# Static prompt text, built once; only the weather JSON varies per call. The
+# per-day and batch prompts share their wording so the two paths cannot drift.
+_PROMPT_ROLE = "You are WeatherWise, a friendly energy-saving assistant."
+_PROMPT_STYLE = (
+    "help a typical household save energy, water, or money. "
+    "Use short, crisp sentences. Avoid repeating the same structure or phrases across tips."
+)
+_PROMPT_CONSTRAINTS = (
+    "- 6–20 words each.\n"
+    "- Each states an action and expected benefit.\n"
+    "- Vary wording and focus (HVAC, lighting, laundry, irrigation, EV, solar, cooking, etc).\n"
+    "- Use Fahrenheit-friendly phrasing if temps look like US units.\n"
+)
+_SYSTEM_PROMPT = (
+    f"{_PROMPT_ROLE} Given a single day's weather data, "
+    f"produce three concrete, varied tips that {_PROMPT_STYLE}"
+)
+_DAY_PROMPT_RULES = (
+    "Return strictly this JSON shape (no extra text):\n"
+    "{\"suggestions\": [\"tip1\", \"tip2\", \"tip3\"]}\n\n"
+    "Constraints:\n"
+    f"- Exactly 3 tips.\n{_PROMPT_CONSTRAINTS}"
+)
+_BATCH_SYSTEM_PROMPT = (
+    f"{_PROMPT_ROLE} Given several days of weather data, "
+    f"produce three concrete, varied tips per day that {_PROMPT_STYLE}"
+)
+_BATCH_PROMPT_RULES = (
+    "Return strictly this JSON shape (no extra text), with one entry per input day, in order:\n"
+    "{\"days\": [{\"suggestions\": [\"tip1\", \"tip2\", \"tip3\"]}, ...]}\n\n"
+    "Constraints:\n"
+    f"- Exactly 3 tips per day.\n{_PROMPT_CONSTRAINTS}"
+)
+
+_ALLOWED_FOCUSES = frozenset({"thermostat", "sprinklers", "solar"})
+
+# Leading/trailing code fences (optionally tagged "json") around model output
+_CODE_FENCE_RE = re.compile(r"^`+(?:json)?\s*|\s*`+$")
+
+# Per-day Gemini calls are independent network round-trips; overlap them.
+_TIP_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Raw Gemini tips keyed on a coarse bucketing of the day's weather; similar
+# weather reuses earlier output and focus rules are applied per request.
+_TIPS_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+_TIPS_CACHE_LOCK = threading.Lock()
+
+# Tips served without calling Gemini when no focus is requested, keyed on
+# (_temp_scale, _weather_bucket). The hand-written seeds for common dry/calm
+# °F days are permanent; other buckets adopt their first Gemini answer for an
+# hour via _LEARNED_TIPS.
+_CANONICAL_TIPS: dict[tuple, list] = {
+    ("F", (0, 0, 0)): [
+        "Cool, dry day — lower the thermostat 2°F and layer up to trim heating costs.",
+        "Open sunny blinds by day for free solar heat; close them at dusk.",
+        "Skip watering — cool air slows evaporation, so soil stays moist and water is saved.",
+    ],
+    ("F", (0, 1, 0)): [
+        "Mild and dry — switch the HVAC off and open windows for free ventilation.",
+        "Water the garden after sunset to cut evaporation and save water.",
+        "Line-dry laundry outdoors today to skip the dryer and save energy.",
+    ],
+    ("F", (0, 2, 0)): [
+        "Hot day — pre-cool the house in the morning, then raise the thermostat 3°F.",
+        "Close blinds on sun-facing windows by midday to cut A/C load.",
+        "Water lawns before 8 AM to reduce evaporation and lower water bills.",
+    ],
+}
+_LEARNED_TIPS: TTLCache = TTLCache(maxsize=64, ttl=3600)
+_LEARNED_TIPS_LOCK = threading.Lock()
+
+# Identical /api/tips requests that arrive while one is already running wait
+# on the leader's result instead of repeating the WeatherAPI + Gemini work.
+# A leader slowed by upstream timeouts/retries can outlast the wait; followers
+# then run the pipeline themselves rather than failing.
+_INFLIGHT: dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+_INFLIGHT_TIMEOUT = 30
+
+# Shared session so WeatherAPI calls reuse pooled TCP/TLS connections.
+# Under the gevent worker (gunicorn.conf.py) requests' patched sockets yield
+# while waiting, as do Gemini calls now that the SDK uses its REST transport.
+_HTTP = requests.Session()
+_HTTP.headers.update({"User-Agent": "WeatherWise/1.0"})
+_HTTP.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            # Hand the final response back so raise_for_status() handling is unchanged
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Forecasts only change on the order of minutes; share them across requests
+# for the same location/units so repeat lookups skip the WeatherAPI round-trip.
+_FORECAST_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_FORECAST_CACHE_LOCK = threading.Lock()
+
+
+_MOCK_DESCRIPTIONS = ("Clear skies", "Partly cloudy", "Light rain", "Sunny", "Scattered clouds")
 
 
 def _mock_forecast_3_days() -> list:
     days = []
+    now = datetime.now()
+    uniform = random.uniform
     for offset in (1, 2, 3):  # Start from tomorrow (offset 1)
-        dt = datetime.now() + timedelta(days=offset)
-        tempmin = 60 + random.uniform(-5, 5)
-        tempmax = 75 + random.uniform(-5, 10)
+        dt = now + timedelta(days=offset)
+        tempmin = 60 + uniform(-5, 5)
+        tempmax = 75 + uniform(-5, 10)
         days.append(
             {
                 "date": dt.strftime("%Y-%m-%d"),
                 "tempmin": round(tempmin, 1),
                 "tempmax": round(tempmax, 1),
-                "humidity": int(35 + random.uniform(0, 50)),
-                "windspeed": round(5 + random.uniform(0, 20), 1),
-                "precip": round(max(0, random.uniform(0, 0.5)), 2),
-                "description": random.choice(
-                    ["Clear skies", "Partly cloudy", "Light rain", "Sunny", "Scattered clouds"]
-                ),
+                "humidity": int(35 + uniform(0, 50)),
+                "windspeed": round(5 + uniform(0, 20), 1),
+                "precip": round(max(0, uniform(0, 0.5)), 2),
+                "description": random.choice(_MOCK_DESCRIPTIONS),
             }
         )
     return days
@@ -60,6 +196,12 @@ def get_weather_forecast(location_param: str, unit_group: str = "us") -> list:
     if not WEATHERAPI_KEY:
         return _mock_forecast_3_days()
 
+    key = (location_param, unit_group)
+    with _FORECAST_CACHE_LOCK:
+        cached = _FORECAST_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     # WeatherAPI forecast (4 days to get tomorrow + next 2)
     url = "https://api.weatherapi.com/v1/forecast.json"
     params = {
@@ -71,7 +213,7 @@ def get_weather_forecast(location_param: str, unit_group: str = "us") -> list:
     }
 
     try:
-        r = requests.get(url, params=params, timeout=12)
+        r = _HTTP.get(url, params=params, timeout=12)
         r.raise_for_status()
         data = r.json()
     except requests.exceptions.HTTPError as http_err:
@@ -111,43 +253,70 @@ def get_weather_forecast(location_param: str, unit_group: str = "us") -> list:
                 "humidity": day.get("avghumidity"),
                 "windspeed": windspeed,
                 "precip": precip or 0,
-                "description": condition.get("text", "Clear"),
+                "description": condition.get("text") or "Clear",
             }
         )
+
+    # Only cache real upstream data; mock fallbacks above are never stored
+    with _FORECAST_CACHE_LOCK:
+        _FORECAST_CACHE[key] = days
     return days
 
 
-def get_fallback_tips(day: dict) -> list:
-    tips = []
-    temp_max = day.get("tempmax", 70) or 70
+# Rule-based tips indexed by weather bucket (bool/int index, see get_fallback_tips)
+_PRECIP_TIPS = (
+    "Dry conditions — water in evening for efficiency.",
+    "Rain expected — skip sprinklers, save water and pump energy.",
+)
+_TEMP_TIPS = (
+    "Cool weather — lower heat by 2°F and wear layers to save energy.",
+    "Mild temps — open windows instead of running HVAC systems.",
+    "Hot day — set thermostat 3°F higher; use fans to cut A/C use.",
+)
+_WIND_TIPS = (
+    "Calm conditions — run appliances during off-peak hours for savings.",
+    "High winds — expect good turbine output; delay noisy generator use.",
+)
+
+
+def _temp_scale(unit_group: str) -> str:
+    # get_weather_forecast only distinguishes "us" (°F) from everything else (°C)
+    return "F" if unit_group == "us" else "C"
+
+
+def _temp_band(temp_max_f: float) -> int:
+    # cool (< 60), mild (60–85), hot (> 85)
+    return (temp_max_f >= 60) + (temp_max_f > 85)
+
+
+def _weather_bucket(day: dict, unit_group: str = "us") -> tuple:
+    """Return (rainy, temp band, windy) as ints; temp band is cool/mild/hot = 0/1/2."""
+    temp_max = day.get("tempmax")
+    if temp_max is None:
+        temp_max = 70
+    elif unit_group != "us":
+        # Non-US forecasts report °C; band on the °F thresholds
+        temp_max = temp_max * 9 / 5 + 32
     precip = day.get("precip", 0) or 0
     wind = day.get("windspeed", 0) or 0
+    return int(precip > 0.1), _temp_band(temp_max), int(wind > 15)
 
-    tips.append(
-        "Rain expected — skip sprinklers, save water and pump energy." if precip > 0.1
-        else "Dry conditions — water in evening for efficiency."
-    )
-    if temp_max > 85:
-        tips.append("Hot day — set thermostat 3°F higher; use fans to cut A/C use.")
-    elif temp_max < 60:
-        tips.append("Cool weather — lower heat by 2°F and wear layers to save energy.")
-    else:
-        tips.append("Mild temps — open windows instead of running HVAC systems.")
-    tips.append(
-        "High winds — expect good turbine output; delay noisy generator use." if wind > 15
-        else "Calm conditions — run appliances during off-peak hours for savings."
-    )
-    return tips[:3]
+
+def get_fallback_tips(day: dict) -> list:
+    rainy, _, windy = _weather_bucket(day)
+    # Historical rule: a missing or zero tempmax counts as a mild 70°F
+    temp_band = _temp_band(day.get("tempmax", 70) or 70)
+    return [_PRECIP_TIPS[rainy], _TEMP_TIPS[temp_band], _WIND_TIPS[windy]]
 
 
 def _apply_focus_rules(day: dict, focus: str | None = None, tips: list | None = None, focuses: list | None = None) -> list:
     """Optionally adjust or prepend tips based on user focus/focuses and weather."""
     tips = tips or []
-    selected = []
+    selected = set()
     if focuses:
-        selected = [str(f).lower() for f in focuses if str(f).lower() in ("thermostat", "sprinklers", "solar")]
+        selected = {s for s in (str(f).lower() for f in focuses) if s in _ALLOWED_FOCUSES}
     elif focus:
-        selected = [str(focus).lower()]
+        selected = {str(focus).lower()}
     if not selected:
         return tips
     desc = (day.get("description") or "").lower()
@@ -165,88 +334,218 @@ def _apply_focus_rules(day: dict, focus: str | None = None, tips: list | None =
     return tips[:3]
 
 
-def generate_tips_gemini(day: dict, focus: str | None, focuses: list | None = None) -> list:
+def _parse_gemini_json(text: str) -> dict | None:
+    """Parse a Gemini reply as a JSON object, tolerating ``` code-fence wrappers."""
+    text = _CODE_FENCE_RE.sub("", text.strip())
+    try:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _tips_cache_key(day: dict, unit_group: str = "us") -> tuple:
+    # Focus is not part of the prompt, so raw Gemini tips are shared across
+    # focuses; _apply_focus_rules runs on every lookup. Temperatures are °F or
+    # °C depending on unit_group, so the scale is part of the key.
+    return (
+        _temp_scale(unit_group),
+        int(day.get("tempmax", 70) or 70),
+        int(day.get("tempmin", 60) or 60),
+        round(day.get("precip", 0) or 0, 1),
+        int((day.get("windspeed", 0) or 0) // 5),
+        (day.get("description") or "").lower(),
+    )
+
+
+def _canonical_key(day: dict, unit_group: str) -> tuple:
+    return _temp_scale(unit_group), _weather_bucket(day, unit_group)
+
+
+def _canonical_tips(day: dict, unit_group: str) -> list | None:
+    key = _canonical_key(day, unit_group)
+    seeded = _CANONICAL_TIPS.get(key)
+    if seeded is not None:
+        return seeded
+    with _LEARNED_TIPS_LOCK:
+        return _LEARNED_TIPS.get(key)
+
+
+def _remember_canonical(day: dict, unit_group: str, tips: list) -> None:
+    key = _canonical_key(day, unit_group)
+    if key in _CANONICAL_TIPS:
+        return
+    with _LEARNED_TIPS_LOCK:
+        if key not in _LEARNED_TIPS:
+            _LEARNED_TIPS[key] = tips
+
+
+def generate_tips_gemini(day: dict, focus: str | None, focuses: list | None = None, unit_group: str = "us") -> list:
     # If Gemini SDK not available or no API key, fall back deterministically
-    if not GEMINI_API_KEY or genai is None:
+    if not _HAS_GEMINI:
         return _apply_focus_rules(day, focus, get_fallback_tips(day), focuses)
 
-    model = genai.GenerativeModel(GEMINI_MODEL)
-    system = (
-        "You are WeatherWise, a friendly energy-saving assistant. Given a single day's weather data, "
-        "produce three concrete, varied tips that help a typical household save energy, water, or money. "
-        "Use short, crisp sentences. Avoid repeating the same structure or phrases across tips."
-    )
-    prompt = (
-        f"Weather JSON: {json.dumps(day)}\n\n"
-        "Return strictly this JSON shape (no extra text):\n"
-        "{\"suggestions\": [\"tip1\", \"tip2\", \"tip3\"]}\n\n"
-        "Constraints:\n"
-        "- Exactly 3 tips.\n"
-        "- 6–20 words each.\n"
-        "- Each states an action and expected benefit.\n"
-        "- Vary wording and focus (HVAC, lighting, laundry, irrigation, EV, solar, cooking, etc).\n"
-        "- Use Fahrenheit-friendly phrasing if temps look like US units.\n"
-    )
+    # Canonical set first, then the tips cache (generate_tips_gemini_batch matches)
+    no_focus = not focus and not focuses
+    if no_focus:
+        canonical = _canonical_tips(day, unit_group)
+        if canonical is not None:
+            return canonical
 
-    res = model.generate_content([system, prompt])
-    text = (getattr(res, "text", None) or "").strip()
+    key = _tips_cache_key(day, unit_group)
+    with _TIPS_CACHE_LOCK:
+        cached = _TIPS_CACHE.get(key)
+    if cached is not None:
+        return _apply_focus_rules(day, focus, cached, focuses)
+
+    prompt = f"Weather JSON: {orjson.dumps(day).decode()}\n\n{_DAY_PROMPT_RULES}"
+
+    res = _GEMINI.generate_content([_SYSTEM_PROMPT, prompt])
+    data = _parse_gemini_json(getattr(res, "text", None) or "")
 
     # Best-effort JSON parsing; fall back if parsing fails
-    try:
-        text = text.strip("`\n ")
-        data = json.loads(text)
-        out = data.get("suggestions")
-        if isinstance(out, list) and len(out) == 3:
-            return _apply_focus_rules(day, focus, [str(x) for x in out], focuses)
-    except Exception:
-        pass
+    out = data.get("suggestions") if data else None
+    if isinstance(out, list) and len(out) == 3:
+        tips = [str(x) for x in out]
+        with _TIPS_CACHE_LOCK:
+            _TIPS_CACHE[key] = tips
+        if no_focus:
+            _remember_canonical(day, unit_group, tips)
+        return _apply_focus_rules(day, focus, tips, focuses)
 
     return _apply_focus_rules(day, focus, get_fallback_tips(day), focuses)
 
 
+def generate_tips_gemini_batch(
+    days: list, focus: str | None, focuses: list | None = None, unit_group: str = "us"
+) -> list:
+    """Generate tips for all forecast days with a single Gemini round-trip.
+
+    Returns one suggestions list per input day. Days already in the tips cache
+    are not sent to Gemini. Falls back to per-day generation if the batched
+    response cannot be parsed.
+    """
+    if not _HAS_GEMINI:
+        return [_apply_focus_rules(d, focus, get_fallback_tips(d), focuses) for d in days]
+
+    no_focus = not focus and not focuses
+    keys = [_tips_cache_key(d, unit_group) for d in days]
+    with _TIPS_CACHE_LOCK:
+        cached = [_TIPS_CACHE.get(k) for k in keys]
+    # Same lookup order as generate_tips_gemini: canonical set, then tips cache
+    results = []
+    for d, c in zip(days, cached):
+        tips = _canonical_tips(d, unit_group) if no_focus else None
+        if tips is None and c is not None:
+            tips = _apply_focus_rules(d, focus, c, focuses)
+        results.append(tips)
+    pending = [i for i, r in enumerate(results) if r is None]
+    if not pending:
+        return results
+    pending_days = [days[i] for i in pending]
+
+    prompt = f"Weather JSON (one entry per day): {orjson.dumps(pending_days).decode()}\n\n{_BATCH_PROMPT_RULES}"
+
+    res = _GEMINI.generate_content([_BATCH_SYSTEM_PROMPT, prompt])
+    data = _parse_gemini_json(getattr(res, "text", None) or "")
+
+    # Best-effort JSON parsing; fall back to per-day generation on failure
+    entries = data.get("days") if data else None
+    if isinstance(entries, list) and len(entries) == len(pending_days):
+        generated = []
+        for d, entry in zip(pending_days, entries):
+            out = entry.get("suggestions") if isinstance(entry, dict) else None
+            if not (isinstance(out, list) and len(out) == 3):
+                break
+            generated.append([str(x) for x in out])
+        else:
+            with _TIPS_CACHE_LOCK:
+                for i, tips in zip(pending, generated):
+                    _TIPS_CACHE[keys[i]] = tips
+            for i, tips in zip(pending, generated):
+                if no_focus:
+                    _remember_canonical(days[i], unit_group, tips)
+                results[i] = _apply_focus_rules(days[i], focus, tips, focuses)
+            return results
+
+    fallback = _TIP_POOL.map(lambda d: generate_tips_gemini(d, focus, focuses, unit_group), pending_days)
+    for i, tips in zip(pending, fallback):
+        results[i] = tips
+    return results
+
+
+def _day_payload(d: dict, suggestions: list) -> dict:
+    # Forecast days already carry every WeatherDay field; they are never mutated
+    # after get_weather_forecast, so the (possibly cached) dict is shared as-is.
+    return {"date": d["date"], "weather": d, "suggestions": suggestions}
+
+
+def _build_tip_days(location_param: str, unit_group: str, focus: str | None, focuses: list | None) -> list:
+    forecast = get_weather_forecast(location_param, unit_group)
+
+    all_suggestions = generate_tips_gemini_batch(forecast, focus, focuses, unit_group)
+
+    return [_day_payload(d, suggestions) for d, suggestions in zip(forecast, all_suggestions)]
+
+
+def _single_flight(key: tuple, fn):
+    """Run fn once per key among concurrent callers; followers share its result."""
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[key] = Future()
+
+    if not leader:
+        try:
+            return future.result(timeout=_INFLIGHT_TIMEOUT)
+        except FutureTimeoutError:
+            return fn()
+
+    try:
+        result = fn()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def _tips_request_params(body: dict) -> tuple | None:
+    """Return (location_param, unit_group, focus, focuses), or None without a location."""
+    location = str(body.get("location", "")).strip()
+    lat = body.get("lat", None)
+    lon = body.get("lon", None)
+
+    if (lat is None or lon is None) and not location:
+        return None
+
+    location_param = f"{lat},{lon}" if lat is not None and lon is not None else location
+    return location_param, str(body.get("unit_group", "us")), body.get("focus"), body.get("focuses")
+
+
 @app.post("/api/tips")
 def tips():
     try:
         body = request.get_json(force=True) or {}
-        location = str(body.get("location", "")).strip()
-        lat = body.get("lat", None)
-        lon = body.get("lon", None)
-        unit_group = body.get("unit_group", "us")
-        focus = body.get("focus")
-        focuses = body.get("focuses")
-
-        if (lat is None or lon is None) and not location:
+        params = _tips_request_params(body)
+        if params is None:
             return jsonify({"error": "Location or lat/lon required"}), 400
+        location_param, unit_group, focus, focuses = params
 
-        if lat is not None and lon is not None:
-            location_param = f"{lat},{lon}"
-            response_location = location_param
-        else:
-            location_param = location
-            response_location = location
-
-        forecast = get_weather_forecast(location_param, unit_group)
-
-        days = []
-        for d in forecast:
-            suggestions = generate_tips_gemini(d, focus, focuses)
-            days.append(
-                {
-                    "date": d["date"],
-                    "weather": {
-                        "date": d["date"],
-                        "tempmin": d.get("tempmin"),
-                        "tempmax": d.get("tempmax"),
-                        "humidity": d.get("humidity"),
-                        "windspeed": d.get("windspeed"),
-                        "precip": d.get("precip", 0),
-                        "description": d.get("description", "Clear"),
-                    },
-                    "suggestions": suggestions,
-                }
-            )
-
-        return jsonify({"location": response_location, "unit_group": unit_group, "days": days})
+        key = (
+            location_param,
+            unit_group,
+            None if focus is None else str(focus),
+            tuple(str(f) for f in focuses or ()),
+        )
+        days = _single_flight(key, lambda: _build_tip_days(location_param, unit_group, focus, focuses))
+
+        return jsonify({"location": location_param, "unit_group": unit_group, "days": days})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
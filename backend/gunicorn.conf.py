@@ -0,0 +1,12 @@
+import multiprocessing
+import os
+
+# Requests spend nearly all their time waiting on WeatherAPI/Gemini, so use
+# gevent workers: each one multiplexes many in-flight requests on one process.
+# gunicorn monkey-patches the stdlib for the gevent worker before loading app.py.
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", "1000"))
+
+bind = f"{os.getenv('HOST', '127.0.0.1')}:{os.getenv('PORT', os.getenv('FLASK_RUN_PORT', '5000'))}"
+timeout = 60